@@ -0,0 +1,67 @@
+#!/usr/bin/env python3
+"""
+Microbenchmark for the socket.io frame codec.
+
+Measures the per-frame cost of decoding a representative ``42`` answer frame
+and encoding a ``perplexity_ask`` emit with every available JSON backend.
+
+Usage: python benchmarks/bench_codec.py [iterations]
+"""
+
+import os
+import sys
+from timeit import timeit
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), ".."))
+
+from perplexity_cli import JSONCodec, orjson  # noqa: E402
+
+
+def sample_frame(codec):
+    """Build a realistic final answer frame (nested JSON-in-JSON)."""
+    answer = {
+        "answer": "Quantum computing uses qubits [1] to explore many states at once. " * 40,
+        "web_results": [
+            {"name": f"Source {i}", "url": f"https://example.com/article/{i}", "snippet": "x" * 200}
+            for i in range(8)
+        ],
+    }
+    steps = [{"step_type": "FINAL", "content": {"answer": codec.dumps(answer).decode("utf-8")}}]
+    content = {"status": "COMPLETED", "final": True, "text": codec.dumps(steps).decode("utf-8")}
+    return codec.encode_frame("42", ["query_progress", content])
+
+
+def sample_emit():
+    return [
+        "perplexity_ask",
+        "What is quantum computing?",
+        {
+            "frontend_session_id": "5f0c5f36-8a4b-4f2e-9a0a-0b1c2d3e4f50",
+            "language": "en-GB",
+            "timezone": "UTC",
+            "search_focus": "internet",
+            "frontend_uuid": "0b1c2d3e-4f50-4f2e-9a0a-5f0c5f368a4b",
+            "mode": "concise",
+        },
+    ]
+
+
+def main():
+    iterations = int(sys.argv[1]) if len(sys.argv) > 1 else 20000
+    backends = ["json"] + (["orjson"] if orjson is not None else [])
+    frame = sample_frame(JSONCodec("json"))
+    emit = sample_emit()
+
+    print(f"Frame size: {len(frame)} bytes, {iterations} iterations")
+    print(f"{'backend':<8} {'decode/frame':>14} {'encode/emit':>14}")
+    for backend in backends:
+        codec = JSONCodec(backend)
+        decode = timeit(lambda: codec.decode_frame(frame), number=iterations)
+        encode = timeit(lambda: codec.encode_frame("421", emit), number=iterations)
+        print(f"{backend:<8} {decode / iterations * 1e6:>11.2f} µs {encode / iterations * 1e6:>11.2f} µs")
+    if orjson is None:
+        print("orjson is not installed; install 'perplexity-cli[fast]' to compare.")
+
+
+if __name__ == "__main__":
+    main()
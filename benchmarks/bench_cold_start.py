@@ -0,0 +1,49 @@
+#!/usr/bin/env python3
+"""
+Cold-start benchmark for the on-disk session state cache.
+
+Times connect + one answer + close against the local fake server, first with
+a full handshake every time and then reusing cached session state, the way
+consecutive short-lived ``pplx`` invocations would.
+
+Usage: python benchmarks/bench_cold_start.py [runs]
+"""
+
+import os
+import sys
+import tempfile
+from time import perf_counter
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), ".."))
+
+from fake_server import FakePerplexityServer  # noqa: E402
+from perplexity_cli import Perplexity, SessionStateCache  # noqa: E402
+
+
+def run(base_url, runs, state_cache=None):
+    start = perf_counter()
+    for i in range(runs):
+        with Perplexity(base_url=base_url, state_cache=state_cache) as client:
+            list(client.generate_answer(f"question {i}"))
+    return (perf_counter() - start) / runs
+
+
+def main():
+    runs = int(sys.argv[1]) if len(sys.argv) > 1 else 200
+    server = FakePerplexityServer().start()
+    with tempfile.TemporaryDirectory() as tmp:
+        cache = SessionStateCache(os.path.join(tmp, "session.json"))
+        # The fake server sets no cookies; seed the cache as a real handshake would
+        with Perplexity(base_url=server.base_url) as client:
+            client.session.cookies.set("__cf_bm", "seed")
+            cache.save(server.base_url, client.session.cookies)
+
+        full = run(server.base_url, runs)
+        cached = run(server.base_url, runs, cache)
+    print(f"Full handshake: {full * 1000:.2f} ms per session")
+    print(f"Cached state:   {cached * 1000:.2f} ms per session")
+    print("Note: the fake server is local; real savings are the skipped HTTP round trips.")
+
+
+if __name__ == "__main__":
+    main()
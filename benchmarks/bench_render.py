@@ -0,0 +1,51 @@
+#!/usr/bin/env python3
+"""
+Benchmark for the incremental Markdown renderer.
+
+Streams answers of growing length through ``MarkdownStreamRenderer`` in
+small frames. The cost per KB should stay flat as answers grow, confirming
+each frame only does work proportional to its own size.
+
+Usage: python benchmarks/bench_render.py [frame_size]
+"""
+
+import os
+import sys
+from time import perf_counter
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), ".."))
+
+from perplexity_cli import MarkdownStreamRenderer  # noqa: E402
+
+SECTION = """## Overview
+Quantum computers use **qubits** [1] that can hold superpositions [2][3].
+- Error correction uses `surface codes` [4]
+- Gate fidelity keeps improving [5]
+1. Superconducting qubits
+2. Trapped ions [6]
+```python
+circuit.h(0)
+```
+A single very long paragraph line """ + "with many words and citations [7] " * 40 + "\n"
+
+
+def main():
+    frame_size = int(sys.argv[1]) if len(sys.argv) > 1 else 16
+    references = [{"url": f"https://example.com/{i}"} for i in range(10)]
+    print(f"Frame size: {frame_size} chars")
+    print(f"{'answer size':>12} {'frames':>8} {'total':>10} {'per KB':>10}")
+    for repeats in (10, 100, 1000):
+        answer = SECTION * repeats
+        renderer = MarkdownStreamRenderer(references, hyperlinks=True)
+        start = perf_counter()
+        for i in range(0, len(answer), frame_size):
+            renderer.feed(answer[i:i + frame_size])
+        renderer.finish()
+        elapsed = perf_counter() - start
+        frames = (len(answer) + frame_size - 1) // frame_size
+        print(f"{len(answer) // 1024:>9} KB {frames:>8} {elapsed * 1000:>7.1f} ms "
+              f"{elapsed / len(answer) * 1024 * 1e6:>7.1f} µs")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,60 @@
+#!/usr/bin/env python3
+"""
+Benchmark for the near-duplicate answer cache.
+
+Indexes synthetic questions and reports insert and lookup latency for
+reworded queries, which should stay well under a millisecond at 100k entries.
+
+Usage: python benchmarks/bench_similarity.py [entries]
+"""
+
+import os
+import sys
+from random import Random
+from time import perf_counter
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), ".."))
+
+from perplexity_cli import DEFAULT_SIMILARITY, AnswerCache  # noqa: E402
+
+TEMPLATES = ["what is {}", "explain {}", "how does {} work", "tell me about {}"]
+
+
+def make_topics(count, rng):
+    words = [f"w{i}" for i in range(5000)]
+    return [" ".join(rng.sample(words, rng.randint(2, 5))) for _ in range(count)]
+
+
+def main():
+    entries = int(sys.argv[1]) if len(sys.argv) > 1 else 100000
+    rng = Random(42)
+    topics = make_topics(entries, rng)
+    cache = AnswerCache(threshold=DEFAULT_SIMILARITY)
+
+    start = perf_counter()
+    for topic in topics:
+        cache.put(TEMPLATES[0].format(topic), "answer", [])
+    insert = perf_counter() - start
+
+    probes = [rng.choice(TEMPLATES[1:]).format(rng.choice(topics)) for _ in range(2000)]
+    # Shuffle word order so lookups go through the similarity index
+    probes += [" ".join(reversed(rng.choice(topics).split())) for _ in range(2000)]
+    misses = [f"unrelated question {i} zz{i}" for i in range(2000)]
+
+    start = perf_counter()
+    found = sum(1 for probe in probes if cache.get(probe) is not None)
+    hit_time = perf_counter() - start
+
+    start = perf_counter()
+    for probe in misses:
+        cache.get(probe)
+    miss_time = perf_counter() - start
+
+    print(f"Indexed {entries} questions in {insert:.2f}s ({insert / entries * 1e6:.1f} µs each)")
+    print(f"Reworded lookups: {found}/{len(probes)} found, {hit_time / len(probes) * 1e6:.1f} µs each")
+    print(f"Miss lookups: {miss_time / len(misses) * 1e6:.1f} µs each")
+    print(f"Cache stats: {cache.stats}")
+
+
+if __name__ == "__main__":
+    main()
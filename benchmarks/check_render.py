@@ -0,0 +1,59 @@
+#!/usr/bin/env python3
+"""
+Chunk-invariance check for the incremental Markdown renderer.
+
+Feeding an answer in one chunk and feeding it character by character (or
+split at random points) must produce the same terminal output. Runs a set
+of known edge cases plus random Markdown-ish strings and exits non-zero on
+the first mismatch.
+
+Usage: python benchmarks/check_render.py [cases] [seed]
+"""
+
+import os
+import sys
+from random import Random
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), ".."))
+
+from perplexity_cli import MarkdownStreamRenderer  # noqa: E402
+
+REFERENCES = [{"url": f"https://example.com/{i}"} for i in range(3)]
+EDGE_CASES = [
+    "`*****`",
+    "a *****b***** c",
+    "#   Heading with spaces",
+    "-   item\n1)   item\n>  quote",
+    "**bold** and `code` [1][2] [12",
+    "```\ncode *not bold*\n```\n",
+]
+ALPHABET = ["*", "*", "`", "[", "1", "2", "]", "#", " ", "-", "+", ">", "\n", "a", ".", ")", "```"]
+
+
+def render(chunks):
+    renderer = MarkdownStreamRenderer(REFERENCES, hyperlinks=True)
+    return "".join(renderer.feed(chunk) for chunk in chunks) + renderer.finish()
+
+
+def check(text, rng):
+    whole = render([text])
+    cuts = sorted(rng.sample(range(len(text) + 1), min(3, len(text) + 1)))
+    splits = [text[i:j] for i, j in zip([0] + cuts, cuts + [len(text)])]
+    return render(list(text)) == whole and render(splits) == whole
+
+
+def main():
+    cases = int(sys.argv[1]) if len(sys.argv) > 1 else 20000
+    rng = Random(int(sys.argv[2]) if len(sys.argv) > 2 else 0)
+    texts = EDGE_CASES + [
+        "".join(rng.choice(ALPHABET) for _ in range(rng.randint(1, 30))) for _ in range(cases)
+    ]
+    for text in texts:
+        if not check(text, rng):
+            print(f"FAIL: output depends on chunking for {text!r}")
+            sys.exit(1)
+    print(f"OK: {len(texts)} cases render the same in one chunk and split up")
+
+
+if __name__ == "__main__":
+    main()
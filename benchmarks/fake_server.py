@@ -0,0 +1,188 @@
+#!/usr/bin/env python3
+"""
+Minimal local stand-in for the Perplexity socket.io endpoint.
+
+Speaks just enough Engine.IO v4 (polling handshake, anonymous auth and the
+WebSocket upgrade) for ``Perplexity(base_url=...)`` to connect and ask
+questions. Used by the stress and benchmark scripts; not a general server.
+
+Questions containing "slow" are never answered. Every ``reject_every``-th
+auth request is refused, to exercise failed construction, and direct
+WebSocket connections (no polling handshake) are refused with
+``reject_direct``.
+"""
+
+import json
+import os
+import socketserver
+import struct
+import sys
+import threading
+from base64 import b64encode
+from hashlib import sha1
+from uuid import uuid4
+
+WS_GUID = "258EAFA5-E914-47DA-95CA-C5AB0DC85B11"
+
+
+def answer_frame(frontend_uuid, question):
+    answer = json.dumps({
+        "answer": f"Answer to: {question}",
+        "web_results": [{"name": "Example", "url": "https://example.com"}],
+        "related_queries": [f"{question} {topic}" for topic in ("details", "history", "examples")],
+    })
+    steps = [{"step_type": "FINAL", "content": {"answer": answer}}]
+    content = {
+        "status": "COMPLETED",
+        "final": True,
+        "frontend_uuid": frontend_uuid,
+        "text": json.dumps(steps),
+    }
+    return "42" + json.dumps(["query_answered", content])
+
+
+class Handler(socketserver.StreamRequestHandler):
+    def handle(self):
+        request_line = self.rfile.readline().decode("latin-1")
+        if not request_line:
+            return
+        headers = {}
+        while True:
+            line = self.rfile.readline().decode("latin-1").strip()
+            if not line:
+                break
+            name, _, value = line.partition(":")
+            headers[name.strip().lower()] = value.strip()
+
+        if headers.get("upgrade", "").lower() == "websocket":
+            self.websocket(headers["sec-websocket-key"], direct="sid=" not in request_line)
+            return
+
+        method = request_line.split(" ", 1)[0]
+        body = self.rfile.read(int(headers.get("content-length", 0) or 0))
+        if method == "GET":
+            self.server.handshakes += 1
+            payload = "0" + json.dumps({
+                "sid": str(uuid4()),
+                "upgrades": ["websocket"],
+                "pingInterval": 25000,
+                "pingTimeout": 20000,
+            })
+        else:
+            payload = "OK" if b"jwt" in body and self.server.accept_auth() else "FAIL"
+        data = payload.encode("utf-8")
+        self.wfile.write(
+            b"HTTP/1.1 200 OK\r\nContent-Type: text/plain\r\n"
+            + f"Content-Length: {len(data)}\r\nConnection: close\r\n\r\n".encode("ascii")
+            + data
+        )
+
+    def websocket(self, key, direct):
+        accept = b64encode(sha1((key + WS_GUID).encode("ascii")).digest()).decode("ascii")
+        self.wfile.write(
+            "HTTP/1.1 101 Switching Protocols\r\nUpgrade: websocket\r\n"
+            f"Connection: Upgrade\r\nSec-WebSocket-Accept: {accept}\r\n\r\n".encode("ascii")
+        )
+        if direct:
+            self.server.direct_connections += 1
+            self.send_frame(1, ("0" + json.dumps({"sid": str(uuid4()), "pingInterval": 25000})).encode("utf-8"))
+        while True:
+            frame = self.read_frame()
+            if frame is None:
+                return
+            opcode, payload = frame
+            if opcode == 8:
+                self.send_frame(8, payload[:2])
+                return
+            if opcode == 9:
+                self.send_frame(10, payload)
+            elif opcode == 1:
+                self.on_text(payload.decode("utf-8"))
+
+    def on_text(self, text):
+        if text == "2probe":
+            self.send_frame(1, b"3probe")
+            return
+        if text.startswith("40{"):
+            if self.server.reject_direct:
+                self.send_frame(1, b'44{"message":"not authorized"}')
+            else:
+                self.send_frame(1, ('40{"sid":"%s"}' % uuid4()).encode("ascii"))
+            return
+        start = text.find("[")
+        if start < 1 or not text[:start].isdigit():
+            return
+        event = json.loads(text[start:])
+        if event[0] != "perplexity_ask" or "slow" in event[1]:
+            return
+        self.send_frame(1, answer_frame(event[2]["frontend_uuid"], event[1]).encode("utf-8"))
+
+    def read_exact(self, size):
+        data = self.rfile.read(size)
+        return data if len(data) == size else None
+
+    def read_frame(self):
+        header = self.read_exact(2)
+        if header is None:
+            return None
+        opcode = header[0] & 0x0F
+        length = header[1] & 0x7F
+        if length == 126:
+            length = struct.unpack("!H", self.read_exact(2))[0]
+        elif length == 127:
+            length = struct.unpack("!Q", self.read_exact(8))[0]
+        mask = self.read_exact(4) if header[1] & 0x80 else None
+        payload = self.read_exact(length) if length else b""
+        if payload is None:
+            return None
+        if mask:
+            payload = bytes(b ^ mask[i % 4] for i, b in enumerate(payload))
+        return opcode, payload
+
+    def send_frame(self, opcode, payload):
+        length = len(payload)
+        if length < 126:
+            header = struct.pack("!BB", 0x80 | opcode, length)
+        elif length < 1 << 16:
+            header = struct.pack("!BBH", 0x80 | opcode, 126, length)
+        else:
+            header = struct.pack("!BBQ", 0x80 | opcode, 127, length)
+        try:
+            self.wfile.write(header + payload)
+        except OSError:
+            pass
+
+
+class FakePerplexityServer(socketserver.ThreadingTCPServer):
+    """Threaded fake server; ``base_url`` is ready once constructed."""
+
+    daemon_threads = True
+    allow_reuse_address = True
+
+    def __init__(self, reject_every=0, reject_direct=False):
+        super().__init__(("127.0.0.1", 0), Handler)
+        self.reject_every = reject_every
+        self.reject_direct = reject_direct
+        self.handshakes = 0
+        self.direct_connections = 0
+        self._auth_count = 0
+        self._lock = threading.Lock()
+        self.base_url = f"http://127.0.0.1:{self.server_address[1]}"
+
+    def accept_auth(self):
+        with self._lock:
+            self._auth_count += 1
+            return not (self.reject_every and self._auth_count % self.reject_every == 0)
+
+    def start(self):
+        threading.Thread(target=self.serve_forever, daemon=True).start()
+        return self
+
+
+if __name__ == "__main__":
+    server = FakePerplexityServer().start()
+    print(f"Fake Perplexity server on {server.base_url} (Ctrl+C to stop)", file=sys.stderr)
+    try:
+        threading.Event().wait()
+    except KeyboardInterrupt:
+        os._exit(0)
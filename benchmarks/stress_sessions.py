@@ -0,0 +1,81 @@
+#!/usr/bin/env python3
+"""
+Session lifecycle stress test against a local fake server.
+
+Creates and closes thousands of ``Perplexity`` sessions, mixing answered,
+timed-out and failed-to-construct sessions, and checks that the number of
+open file descriptors and live threads does not grow.
+
+Usage: python benchmarks/stress_sessions.py [sessions]
+"""
+
+import gc
+import os
+import sys
+import threading
+from time import perf_counter, sleep
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), ".."))
+
+from fake_server import FakePerplexityServer  # noqa: E402
+from perplexity_cli import Perplexity, extract_answer_from_response  # noqa: E402
+
+
+def open_fds():
+    try:
+        return len(os.listdir("/proc/self/fd"))
+    except OSError:
+        return None  # Not available on this platform
+
+
+def run_session(base_url, i):
+    """Run one session; returns 'answered', 'timeout' or 'failed'."""
+    try:
+        with Perplexity(base_url=base_url) as client:
+            if i % 10 == 3:
+                request_id = client.ask("slow question")
+                list(client.stream(request_id, timeout=0.05))
+                return "timeout"
+            answer, _ = extract_answer_from_response(list(client.generate_answer(f"question {i}")))
+            return "answered" if answer else "failed"
+    except Exception:
+        return "failed"
+
+
+def settle():
+    gc.collect()
+    sleep(0.2)
+    return open_fds(), threading.active_count()
+
+
+def main():
+    sessions = int(sys.argv[1]) if len(sys.argv) > 1 else 2000
+    server = FakePerplexityServer(reject_every=7).start()
+
+    for i in range(20):  # Warm up imports, pools and the server
+        run_session(server.base_url, i)
+    fds_before, threads_before = settle()
+
+    outcomes = {"answered": 0, "timeout": 0, "failed": 0}
+    start = perf_counter()
+    for i in range(sessions):
+        outcomes[run_session(server.base_url, i)] += 1
+    elapsed = perf_counter() - start
+    fds_after, threads_after = settle()
+
+    print(f"{sessions} sessions in {elapsed:.1f}s ({elapsed / sessions * 1000:.1f} ms each): {outcomes}")
+    print(f"Threads: {threads_before} -> {threads_after}")
+    if fds_before is not None:
+        print(f"Open fds: {fds_before} -> {fds_after}")
+
+    leaked = threads_after - threads_before > 2
+    if fds_before is not None:
+        leaked = leaked or fds_after - fds_before > 5
+    if leaked:
+        print("FAIL: resources grew across sessions")
+        sys.exit(1)
+    print("OK: no fd or thread growth")
+
+
+if __name__ == "__main__":
+    main()
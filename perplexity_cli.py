@@ -19,76 +19,363 @@ __url__ = "https://github.com/zahidoverflow/perplexity-cli"
 
 from uuid import uuid4
 from time import sleep, time
-from threading import Thread
-from json import loads, dumps
-from random import getrandbits
+from threading import Condition, Event, Lock, Thread, current_thread, local
+from queue import Empty, Queue
+from socket import SHUT_RDWR
+from contextlib import contextmanager, suppress
+from json import JSONDecodeError, JSONDecoder, dumps
+from random import Random, getrandbits
+from array import array
+from zlib import crc32
+from hashlib import blake2b
+from struct import Struct, error as struct_error
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from websocket import WebSocketApp
 from requests import Session
 import subprocess
+import mmap
+import os
+import re
 import sys
 import signal
 import readline
 
+try:
+    import orjson
+except ImportError:  # Optional accelerated JSON backend
+    orjson = None
+
+try:
+    import fcntl
+except ImportError:  # Windows: session cache writes are still atomic, just unlocked
+    fcntl = None
+
+
+class JSONCodec:
+    """JSON codec for socket.io frames and answer payloads.
+
+    Uses orjson when it is installed and falls back to the standard library
+    otherwise. Frames are decoded from an offset into the received buffer,
+    so the packet prefix (``42``, ``43<ack>``) is never sliced off into an
+    intermediate string before parsing.
+    """
+
+    backends = ("orjson", "json")
+    _WHITESPACE = re.compile(r"[ \t\n\r]*")
+
+    def __init__(self, backend=None):
+        if backend is None:
+            backend = "orjson" if orjson is not None else "json"
+        if backend not in self.backends:
+            raise ValueError(f"Unknown JSON backend: {backend}")
+        if backend == "orjson" and orjson is None:
+            raise ValueError("The orjson backend requires the 'orjson' package")
+        self.backend = backend
+        self._decoder = JSONDecoder()
+
+    def loads(self, data, offset=0):
+        """Decode the JSON document that starts at ``offset`` in ``data``."""
+        if self.backend == "orjson":
+            if offset:
+                if isinstance(data, str):
+                    data = data.encode("utf-8")
+                data = memoryview(data)[offset:]
+            return orjson.loads(data)
+        if not isinstance(data, str):
+            # The prefix is ASCII, so byte and character offsets agree
+            data = str(data, "utf-8")
+        # Accept exactly what orjson does: surrounding whitespace, nothing else
+        obj, end = self._decoder.raw_decode(data, self._WHITESPACE.match(data, offset).end())
+        if self._WHITESPACE.match(data, end).end() != len(data):
+            raise JSONDecodeError("Extra data", data, end)
+        return obj
+
+    def dumps(self, obj):
+        """Encode ``obj`` as compact UTF-8 JSON bytes."""
+        if self.backend == "orjson":
+            return orjson.dumps(obj)
+        return dumps(obj, ensure_ascii=False, separators=(",", ":")).encode("utf-8")
+
+    def encode_frame(self, prefix, obj):
+        """Build a socket.io frame: ``prefix`` followed by ``obj`` as JSON."""
+        return prefix.encode("ascii") + self.dumps(obj)
+
+    def decode_frame(self, message):
+        """Split a socket.io frame into ``(packet_type, ack_id, payload)``.
+
+        Accepts ``str`` or ``bytes`` frames. Returns ``(None, None, None)``
+        for frames that carry no JSON payload.
+        """
+        start = message.find(b"[" if isinstance(message, (bytes, bytearray)) else "[")
+        if start < 2:
+            return None, None, None
+        head = message[:start]
+        if not isinstance(head, str):
+            head = head.decode("ascii")
+        ack_id = int(head[2:]) if len(head) > 2 else None
+        return head[:2], ack_id, self.loads(message, start)
+
+
+default_codec = JSONCodec()
+
+
+def cache_dir():
+    """Per-user cache directory for perplexity-cli."""
+    if sys.platform == "win32":
+        base = os.environ.get("LOCALAPPDATA") or os.path.expanduser("~")
+    else:
+        base = os.environ.get("XDG_CACHE_HOME") or os.path.join(os.path.expanduser("~"), ".cache")
+    return os.path.join(base, "perplexity-cli")
+
+
+class SessionStateCache:
+    """On-disk cache of session cookies shared by concurrent processes.
+
+    State is stored per base URL in a small JSON file, written atomically
+    and guarded by an advisory lock file (where ``fcntl`` is available) so
+    concurrent ``pplx`` invocations never read a half-written file. Entries
+    older than ``max_age`` seconds and expired cookies are ignored.
+    """
+
+    def __init__(self, path=None, max_age=12 * 3600):
+        self.path = path or os.path.join(cache_dir(), "session.json")
+        self.max_age = max_age
+
+    @contextmanager
+    def _locked(self, exclusive):
+        # The cache holds session cookies: keep it private to the user
+        os.makedirs(os.path.dirname(self.path), mode=0o700, exist_ok=True)
+        with os.fdopen(os.open(self.path + ".lock", os.O_WRONLY | os.O_CREAT, 0o600), "w") as lock_file:
+            if fcntl is not None:
+                fcntl.flock(lock_file, fcntl.LOCK_EX if exclusive else fcntl.LOCK_SH)
+            try:
+                yield
+            finally:
+                if fcntl is not None:
+                    fcntl.flock(lock_file, fcntl.LOCK_UN)
+
+    def _read(self):
+        try:
+            with open(self.path, "rb") as f:
+                data = default_codec.loads(f.read())
+        except (OSError, ValueError):
+            return {}
+        return data if isinstance(data, dict) else {}
+
+    def load(self, base_url):
+        """Return the cached state for ``base_url``, or ``None``.
+
+        The state holds ``cookies`` (a list of dicts) and ``direct``, whether
+        the server accepted a direct WebSocket connection with them.
+        """
+        try:
+            with self._locked(exclusive=False):
+                state = self._read().get(base_url)
+        except OSError:
+            return None
+        now = time()
+        if not state or now - state.get("saved_at", 0) > self.max_age:
+            return None
+        cookies = [c for c in state.get("cookies", []) if not c.get("expires") or c["expires"] > now]
+        if not cookies:
+            return None
+        return {"cookies": cookies, "direct": state.get("direct", True)}
+
+    def save(self, base_url, cookie_jar, direct=True):
+        """Store the cookies of a freshly handshaken session."""
+        cookies = [
+            {"name": c.name, "value": c.value, "domain": c.domain, "path": c.path, "expires": c.expires}
+            for c in cookie_jar
+        ]
+        self._update(base_url, {"saved_at": time(), "cookies": cookies, "direct": direct})
+
+    def invalidate(self, base_url):
+        self._update(base_url, None)
+
+    def _update(self, base_url, state):
+        try:
+            with self._locked(exclusive=True):
+                data = self._read()
+                if state is None:
+                    data.pop(base_url, None)
+                else:
+                    data[base_url] = state
+                tmp_path = f"{self.path}.{os.getpid()}.tmp"
+                with suppress(FileNotFoundError):
+                    os.remove(tmp_path)  # Left over by a crashed run; O_EXCL below
+                flags = os.O_WRONLY | os.O_CREAT | os.O_EXCL | getattr(os, "O_BINARY", 0)
+                with os.fdopen(os.open(tmp_path, flags, 0o600), "wb") as f:
+                    f.write(default_codec.dumps(data))
+                os.replace(tmp_path, self.path)
+        except OSError:
+            pass  # The cache is an optimization; never fail a session over it
+
 
 class Perplexity:
-    def __init__(self):
+    """Anonymous Perplexity session over a socket.io WebSocket.
+
+    Use as a context manager, or call :meth:`close` when done, so the
+    WebSocket thread and the HTTP session are shut down deterministically.
+
+    With a :class:`SessionStateCache`, cookies from an earlier handshake are
+    reused to open the WebSocket directly and authenticate over it, skipping
+    the polling handshake; if the server rejects that, a full handshake is
+    done and its cookies are cached for the next session.
+    """
+
+    base_url = "https://www.perplexity.ai"
+    state_cache = None
+
+    def __init__(self, codec=None, base_url=None, state_cache=None):
+        self.codec = codec or default_codec
+        if base_url is not None:
+            self.base_url = base_url.rstrip("/")
+        if state_cache is not None:
+            self.state_cache = state_cache
         self.session = Session()
+        self.ws = None
+        self.ws_thread = None
+        self.closed = False
         self.user_agent = {
             "User-Agent": "Ask/2.4.1/224 (iOS; iPhone; Version 18.1) isiOSOnMac/false",
             "X-Client-Name": "Perplexity-iOS",
         }
         self.session.headers.update(self.user_agent)
         self.t = format(getrandbits(32), "08x")
-        URL = f"https://www.perplexity.ai/socket.io/?EIO=4&transport=polling&t={self.t}"
-        self.sid = loads(self.session.get(url=URL).text[1:])["sid"]
         self.n = 1
         self.base = 420
         self.finished = True
         self.last_uuid = None
+        self.request_id = None
+        self.cancelled = False
+        self.queue = Queue()
+        self._cancel = Event()
+        try:
+            self._connect()
+        except BaseException:
+            self.close()
+            raise
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
+
+    def _connect(self):
+        state = self.state_cache.load(self.base_url) if self.state_cache else None
+        direct = True
+        if state is not None:
+            for cookie in state["cookies"]:
+                self.session.cookies.set(**cookie)
+            if state["direct"]:
+                try:
+                    self._open_websocket(sid=None, timeout=3)
+                    return
+                except Exception:
+                    # Rejected: fall back to a full handshake and stop trying
+                    # direct connections until the cached state expires
+                    self._shutdown_websocket()
+                    direct = False
+            else:
+                direct = False
+        
+        URL = f"{self.base_url}/socket.io/?EIO=4&transport=polling&t={self.t}"
+        sid = self.codec.loads(self.session.get(url=URL).content, 1)["sid"]
         
         # Test the anonymous user authentication
         auth_response = self.session.post(
-            url=f"https://www.perplexity.ai/socket.io/?EIO=4&transport=polling&t={self.t}&sid={self.sid}",
+            url=f"{self.base_url}/socket.io/?EIO=4&transport=polling&t={self.t}&sid={sid}",
             data='40{"jwt":"anonymous-ask-user"}',
         )
         if auth_response.text != "OK":
             raise Exception("Failed to authenticate anonymous user.")
-            
+        
+        self._open_websocket(sid)
+        if self.state_cache is not None:
+            self.state_cache.save(self.base_url, self.session.cookies, direct)
+
+    def _open_websocket(self, sid, timeout=5):
+        """Connect the WebSocket, upgrading ``sid`` or, without one, connecting directly."""
+        self.sid = sid
+        self._opened = Event()
         self.ws = self._init_websocket()
-        self.ws_thread = Thread(target=self.ws.run_forever).start()
+        # Receive frames as raw bytes so they can be decoded without copies
+        self.ws_thread = Thread(
+            target=self.ws.run_forever,
+            kwargs={"skip_utf8_validation": True},
+            name="perplexity-ws",
+            daemon=True,
+        )
+        self.ws_thread.start()
         
         # Wait for connection
-        retry_count = 0
-        while not (self.ws.sock and self.ws.sock.connected) and retry_count < 50:
-            sleep(0.1)
-            retry_count += 1
-        
-        if retry_count >= 50:
-            raise Exception("WebSocket connection timeout")
+        deadline = time() + timeout
+        while not self._opened.wait(0.05):
+            if not self.ws_thread.is_alive():
+                raise Exception("WebSocket connection failed")
+            if time() > deadline:
+                raise Exception("WebSocket connection timeout")
+
+    def _shutdown_websocket(self, timeout=2):
+        """Close the WebSocket and wait up to ``timeout`` seconds for its thread."""
+        if self.ws is not None:
+            self.ws.keep_running = False
+            ws_sock = self.ws.sock
+            if ws_sock is not None and ws_sock.sock is not None:
+                try:
+                    ws_sock.send_close()
+                    # Wake the WebSocket thread blocked in select() so it
+                    # sees keep_running and tears down right away
+                    ws_sock.sock.shutdown(SHUT_RDWR)
+                except OSError:
+                    pass
+        if self.ws_thread is not None and self.ws_thread is not current_thread():
+            self.ws_thread.join(timeout)
+        if self.ws is not None:
+            self.ws.close(timeout=0)
+        self.ws = None
+        self.ws_thread = None
 
     def _init_websocket(self):
         def on_open(ws):
-            ws.send("2probe")
-            ws.send("5")
+            if self.sid is not None:
+                # Upgrade the polling session
+                ws.send("2probe")
+                ws.send("5")
+                self._opened.set()
 
         def on_message(ws, message):
             try:
-                if message == "2":
+                if message == b"2" or message == "2":
                     ws.send("3")
+                elif not self._opened.is_set():
+                    # Direct connection: Engine.IO open, then socket.io auth
+                    head = message[:2]
+                    if head == b"40" or head == "40":
+                        self._opened.set()
+                    elif head == b"44" or head == "44":
+                        ws.close(timeout=1)  # Connection refused
+                    elif head[:1] == b"0" or head[:1] == "0":
+                        ws.send('40{"jwt":"anonymous-ask-user"}')
                 elif not self.finished:
-                    if message.startswith("42"):
-                        message_data = loads(message[2:])
+                    packet, ack_id, message_data = self.codec.decode_frame(message)
+                    # Late frames of a cancelled or earlier request are dropped;
+                    # so are frames that don't say which request they answer
+                    queue = self.queue
+                    if packet == "42":
                         content = message_data[1]
+                        if not isinstance(content, dict) or content.get("frontend_uuid") != self.last_uuid:
+                            return
                         
-                        self.queue.append(content)
+                        queue.put(content)
                         
                         # Check if this is the final message
                         if content.get("final") and content.get("status") == "COMPLETED":
                             self.finished = True
                             
-                    elif message.startswith("43"):
-                        message_data = loads(message[3:])[0]
-                        self.queue.append(message_data)
+                    elif packet == "43" and ack_id == self.request_id:
+                        queue.put(message_data[0])
                         self.finished = True
             except Exception as e:
                 pass  # Ignore parsing errors
@@ -100,8 +387,12 @@ class Perplexity:
         for key, value in self.session.cookies.get_dict().items():
             cookies += f"{key}={value}; "
             
+        # http(s)://host -> ws(s)://host
+        url = "ws" + self.base_url[len("http"):] + "/socket.io/?EIO=4&transport=websocket"
+        if self.sid is not None:
+            url += f"&sid={self.sid}"
         return WebSocketApp(
-            url=f"wss://www.perplexity.ai/socket.io/?EIO=4&transport=websocket&sid={self.sid}",
+            url=url,
             header=self.user_agent,
             cookie=cookies[:-2],
             on_open=on_open,
@@ -109,18 +400,39 @@ class Perplexity:
             on_error=on_error,
         )
 
-    def generate_answer(self, query):
-        self.finished = False
+    @property
+    def connected(self):
+        """Whether the WebSocket connection is open and can take a request."""
+        return bool(self.ws and self.ws.sock and self.ws.sock.connected)
+
+    @property
+    def busy(self):
+        """Whether a request is in flight."""
+        return not self.finished
+
+    def ask(self, query):
+        """Send ``query`` and return its request id.
+
+        A request that is still in flight is cancelled first; the connection
+        handles one answer at a time.
+        """
+        if self.busy:
+            self.cancel()
         if self.n == 9:
             self.n = 0
             self.base *= 10
         else:
             self.n += 1
-        self.queue = []
+        self.request_id = self.base + self.n
+        self.last_uuid = str(uuid4())
+        self.queue = Queue()
+        self.cancelled = False
+        self._cancel.clear()
+        self.finished = False
         
         self.ws.send(
-            str(self.base + self.n)
-            + dumps(
+            self.codec.encode_frame(
+                str(self.request_id),
                 [
                     "perplexity_ask",
                     query,
@@ -129,21 +441,100 @@ class Perplexity:
                         "language": "en-GB",
                         "timezone": "UTC",
                         "search_focus": "internet",
-                        "frontend_uuid": str(uuid4()),
+                        "frontend_uuid": self.last_uuid,
                         "mode": "concise",
                     },
-                ]
+                ],
             )
         )
-        
+        return self.request_id
+
+    def cancel(self, request_id=None):
+        """Stop waiting for a request and discard its remaining frames.
+
+        Cancels the request in flight, or only ``request_id`` when given.
+        The connection stays open for the next :meth:`ask`. Safe to call from
+        other threads and signal handlers. Returns ``True`` if a request was
+        cancelled.
+        """
+        if self.finished or (request_id is not None and request_id != self.request_id):
+            return False
+        self.cancelled = True
+        self.finished = True
+        self._cancel.set()
+        return True
+
+    def stream(self, request_id, timeout=30):
+        """Yield the response frames of ``request_id``.
+
+        Stops when the answer completes, after ``timeout`` seconds or as soon
+        as the request is cancelled.
+        """
+        queue = self.queue
         start_time = time()
-        while (not self.finished) or len(self.queue) != 0:
-            if time() - start_time > 30:
-                self.finished = True
-                return [{"error": "Timed out."}]
-            if len(self.queue) != 0:
-                yield self.queue.pop(0)
-        self.ws.close()
+        while request_id == self.request_id and not self._cancel.is_set():
+            remaining = timeout - (time() - start_time)
+            if remaining <= 0:
+                self.finished = True  # Timed out; drop any late frames
+                return
+            try:
+                yield queue.get(timeout=min(remaining, 0.1))
+            except Empty:
+                pass
+            # Frames are queued before the request is marked finished
+            if self.finished and queue.empty():
+                return
+
+    def generate_answer(self, query):
+        yield from self.stream(self.ask(query))
+
+    def close(self, timeout=2):
+        """Cancel any request in flight and shut the session down.
+
+        Closes the WebSocket, waits up to ``timeout`` seconds for its thread
+        to exit and closes the HTTP session. Safe to call more than once.
+        """
+        if self.closed:
+            return
+        self.closed = True
+        self.cancel()
+        try:
+            self._shutdown_websocket(timeout)
+        finally:
+            self.session.close()
+
+
+class WarmClient:
+    """Lazily connected :class:`Perplexity` client reused across questions.
+
+    Reconnects on the next :meth:`get` once the connection has dropped, so
+    callers keep a warm session without handling reconnects themselves.
+    """
+
+    def __init__(self):
+        self.client = None
+
+    @property
+    def busy(self):
+        return self.client is not None and self.client.busy
+
+    def get(self):
+        """Return a connected client, reconnecting if needed."""
+        if self.client is None or not self.client.connected:
+            if self.client is not None:
+                self.client.close()
+            self.client = None
+            self.client = Perplexity()
+        return self.client
+
+    def cancel(self, request_id=None):
+        """Cancel the request in flight, keeping the connection open."""
+        return self.client is not None and self.client.cancel(request_id)
+
+    def close(self):
+        if self.client is not None:
+            self.client.close()
+            self.client = None
 
 
 class tColor:
@@ -159,6 +550,162 @@ class tColor:
     aqua2 = '\033[38;5;158m'
 
 
+class MarkdownStreamRenderer:
+    """Incremental Markdown renderer for streamed answers.
+
+    ``feed()`` takes the next chunk of answer text and returns the ANSI
+    output for it. Only the new text is processed; the few characters that
+    could still turn into a construct once the next chunk arrives (a line
+    start that may be a heading or list marker, a trailing run of ``*``, an
+    unfinished ``[12`` citation, a code fence) are held back until they are
+    decided, so the output doesn't depend on how the answer is chunked.
+    ``[n]`` citations are highlighted and, when ``hyperlinks`` is enabled,
+    linked to ``references[n - 1]['url']``.
+    """
+
+    _INLINE = re.compile(r"\*\*|`|\[(\d{1,3})\]")
+    _BLOCK = re.compile(r"(#{1,6}) +|([-*+]) +|(\d{1,3})[.)] +|> ?")
+    _BLOCK_PREFIX = re.compile(r"#{0,6}|#{1,6} +|[-*+] *|\d{1,3}[.)]?|\d{1,3}[.)] +|> ?|`{1,2}")
+    _CITATION_TAIL = re.compile(r"\[\d{0,3}$")
+
+    def __init__(self, references=None, hyperlinks=None):
+        self.references = references or []
+        self.hyperlinks = sys.stdout.isatty() if hyperlinks is None else hyperlinks
+        self.base_style = tColor.aqua2
+        self._pending = ""
+        self._line_start = True
+        self._line_style = ""
+        self._code_block = False
+        self._bold = False
+        self._code = False
+
+    def _style(self):
+        style = tColor.reset + self.base_style + self._line_style
+        if self._bold:
+            style += tColor.bold
+        if self._code:
+            style += tColor.lavand
+        return style
+
+    def _citation(self, number):
+        label = f"{tColor.blue}[{number}]{self._style()}"
+        index = int(number) - 1
+        if self.hyperlinks and 0 <= index < len(self.references):
+            url = self.references[index].get("url")
+            if url:
+                return f"\033]8;;{url}\033\\{label}\033]8;;\033\\"
+        return label
+
+    def _start_line(self, text, pos, final):
+        """Classify the line starting at ``pos``; returns the new position or ``None`` to wait."""
+        end = text.find("\n", pos)
+        line = text[pos:] if end == -1 else text[pos:end]
+
+        if line.startswith("```"):
+            if end == -1 and not final:
+                return None
+            self._code_block = not self._code_block
+            self._line_style = tColor.lavand if self._code_block else ""
+            return len(text) if end == -1 else end + 1
+
+        if end == -1 and not final and (
+            self._BLOCK_PREFIX.fullmatch(line) or (self._code_block and "```".startswith(line))
+        ):
+            return None
+
+        self._line_start = False
+        if self._code_block:
+            self._line_style = tColor.lavand
+            self._out.append(self._style() + "    ")
+            return pos
+
+        out = ""
+        match = self._BLOCK.match(text, pos)
+        if match is None:
+            self._line_style = ""
+        elif match.group(1):
+            self._line_style = tColor.bold + tColor.purple
+        elif match.group(2):
+            self._line_style = ""
+            out = "  • "
+        elif match.group(3):
+            self._line_style = ""
+            out = f"  {match.group(3)}. "
+        else:
+            self._line_style = tColor.lavand
+            out = "  │ "
+        self._out.append(self._style() + out)
+        return pos if match is None else match.end()
+
+    def _inline(self, text, pos, end, final):
+        """Render ``text[pos:end]`` (no newline); returns where rendering stopped."""
+        if self._code_block:
+            self._out.append(text[pos:end])
+            return end
+        if not final:
+            # A run of '*' pairs up differently depending on its full length
+            stars = end
+            while stars > pos and text[stars - 1] == "*":
+                stars -= 1
+            tail = self._CITATION_TAIL.search(text, max(pos, stars - 4), stars)
+            end = tail.start() if tail is not None else stars
+
+        for match in self._INLINE.finditer(text, pos, end):
+            self._out.append(text[pos:match.start()])
+            token = match.group()
+            if token == "`":
+                self._code = not self._code
+                self._out.append(self._style())
+            elif self._code:
+                self._out.append(token)
+            elif token == "**":
+                self._bold = not self._bold
+                self._out.append(self._style())
+            else:
+                self._out.append(self._citation(match.group(1)))
+            pos = match.end()
+        self._out.append(text[pos:end])
+        return end
+
+    def _render(self, text, final):
+        self._out = out = []
+        pos = 0
+        length = len(text)
+        while pos < length:
+            if self._line_start:
+                start = self._start_line(text, pos, final)
+                if start is None:
+                    break
+                pos = start
+                continue
+            newline = text.find("\n", pos)
+            if newline == -1:
+                pos = self._inline(text, pos, length, final)
+                break
+            self._inline(text, pos, newline, True)
+            out.append(tColor.reset + "\n")
+            pos = newline + 1
+            self._line_start = True
+            self._bold = self._code = False
+        self._pending = text[pos:]
+        self._out = None
+        return "".join(out)
+
+    def feed(self, delta):
+        """Render the next chunk of the answer and return its terminal output."""
+        return self._render(self._pending + delta, False)
+
+    def finish(self):
+        """Flush any held-back text and reset the terminal style."""
+        return self._render(self._pending, True) + tColor.reset
+
+
+def render_markdown(text, references=None):
+    """Render a complete Markdown answer for the terminal."""
+    renderer = MarkdownStreamRenderer(references)
+    return renderer.feed(text) + renderer.finish()
+
+
 def extract_answer_from_response(response_list):
     """Extract answer and references from response"""
     answer_text = ""
@@ -169,14 +716,14 @@ def extract_answer_from_response(response_list):
         if isinstance(item, dict) and item.get("final") and item.get("status") == "COMPLETED" and "text" in item:
             try:
                 # Parse the text field which contains step information
-                steps = loads(item["text"])
+                steps = default_codec.loads(item["text"])
                 for step in steps:
                     if step.get("step_type") == "FINAL" and "content" in step:
                         content = step["content"]
                         if "answer" in content:
                             try:
                                 # The answer is JSON-encoded
-                                answer_data = loads(content["answer"])
+                                answer_data = default_codec.loads(content["answer"])
                                 answer_text = answer_data.get("answer", "")
                                 references = answer_data.get("web_results", [])
                             except:
@@ -189,10 +736,867 @@ def extract_answer_from_response(response_list):
     return answer_text, references
 
 
+def extract_related_queries(response_list):
+    """Extract the suggested follow-up questions from a response."""
+    related = []
+    for item in response_list:
+        if isinstance(item, dict) and item.get("final") and item.get("status") == "COMPLETED":
+            related.extend(item.get("related_queries") or [])
+            try:
+                for step in default_codec.loads(item.get("text") or "[]"):
+                    if step.get("step_type") == "FINAL" and "content" in step:
+                        content = step["content"]
+                        related.extend(content.get("related_queries") or [])
+                        try:
+                            answer_data = default_codec.loads(content.get("answer") or "{}")
+                            related.extend(answer_data.get("related_queries") or [])
+                        except (ValueError, AttributeError):
+                            pass
+            except (ValueError, TypeError, AttributeError):
+                pass
+            break
+
+    questions = []
+    seen = set()
+    for query in related:
+        if isinstance(query, dict):
+            query = query.get("text") or query.get("query")
+        if isinstance(query, str) and query.strip() and query_key(query) not in seen:
+            seen.add(query_key(query))
+            questions.append(query.strip())
+    return questions
+
+
+QUERY_STOP_WORDS = frozenset(
+    "a an the is are was were be been am do does did of in on at to for from by with "
+    "about into and or what whats "
+    "explain describe define definition meaning tell me us please can could would "
+    "should you i my your it its this that these those give show there work works mean means".split()
+)
+
+
+def normalize_query(query):
+    """Reduce a question to its content words, used by the similarity index."""
+    return tuple(
+        word for word in re.findall(r"[a-z0-9]+", query.lower())
+        if word not in QUERY_STOP_WORDS
+    )
+
+
+def query_key(question):
+    """Exact-match key for a question: the whole text, lowercased and with
+    whitespace and trailing punctuation normalized."""
+    return " ".join(question.lower().split()).rstrip("?!. ")
+
+
+DEFAULT_SIMILARITY = 0.8
+
+
+class SimilarityIndex:
+    """MinHash/LSH index over the content words of past questions.
+
+    Each question is reduced to a ``num_perm`` MinHash signature stored in a
+    flat ``array``; signatures are split into ``bands`` whose hashes point to
+    candidate entries, so a lookup only compares against questions sharing at
+    least one band instead of scanning the whole index.
+    """
+
+    _PRIME = (1 << 61) - 1
+
+    def __init__(self, num_perm=32, bands=8, seed=1):
+        if num_perm % bands:
+            raise ValueError("num_perm must be divisible by bands")
+        rng = Random(seed)
+        self.num_perm = num_perm
+        self.bands = bands
+        self.rows = num_perm // bands
+        self._perms = [
+            (rng.randrange(1, self._PRIME), rng.randrange(0, self._PRIME))
+            for _ in range(num_perm)
+        ]
+        self._signatures = array("Q")
+        self._buckets = [{} for _ in range(bands)]
+
+    def __len__(self):
+        return len(self._signatures) // self.num_perm
+
+    def signature(self, tokens):
+        """Return the MinHash signature for a set of tokens."""
+        hashes = [crc32(token.encode("utf-8")) for token in set(tokens)]
+        prime = self._PRIME
+        return [min((a * h + b) % prime for h in hashes) for a, b in self._perms]
+
+    def _band_keys(self, signature):
+        rows = self.rows
+        return [hash(tuple(signature[i:i + rows])) for i in range(0, self.num_perm, rows)]
+
+    def add(self, tokens):
+        """Index ``tokens`` and return the new entry id."""
+        signature = self.signature(tokens)
+        entry_id = len(self)
+        self._signatures.extend(signature)
+        for bucket, key in zip(self._buckets, self._band_keys(signature)):
+            bucket.setdefault(key, []).append(entry_id)
+        return entry_id
+
+    def query(self, tokens, threshold):
+        """Return ``(entry_id, similarity)`` of the closest entry, or ``None``."""
+        if not tokens or not len(self):
+            return None
+        signature = self.signature(tokens)
+        candidates = set()
+        for bucket, key in zip(self._buckets, self._band_keys(signature)):
+            candidates.update(bucket.get(key, ()))
+
+        best = None
+        num_perm = self.num_perm
+        for entry_id in candidates:
+            start = entry_id * num_perm
+            stored = self._signatures[start:start + num_perm]
+            similarity = sum(1 for x, y in zip(signature, stored) if x == y) / num_perm
+            if similarity >= threshold and (best is None or similarity > best[1]):
+                best = (entry_id, similarity)
+        return best
+
+
+class CachedAnswer:
+    """An answer served from :class:`AnswerCache`."""
+
+    def __init__(self, question, answer, references, similarity=1.0):
+        self.question = question
+        self.answer = answer
+        self.references = references
+        self.similarity = similarity
+
+    @property
+    def exact(self):
+        return self.similarity >= 1.0
+
+
+class AnswerCache:
+    """In-memory answer cache with optional near-duplicate lookup.
+
+    Exact lookups match on the normalized question. When ``threshold`` is
+    set, misses fall back to a :class:`SimilarityIndex` and return the stored
+    answer of the closest past question whose estimated similarity is at
+    least ``threshold``. The index is updated on every :meth:`put`.
+    """
+
+    def __init__(self, threshold=None):
+        if threshold is not None and not 0 < threshold <= 1:
+            raise ValueError("Similarity threshold must be between 0 and 1")
+        self.threshold = threshold
+        self.index = SimilarityIndex() if threshold is not None else None
+        self._entries = []
+        self._by_key = {}
+        self._by_index_id = []
+        self._lock = Lock()  # Background prefetches write concurrently
+        self.stats = {"hits": 0, "near_hits": 0, "misses": 0}
+
+    def __len__(self):
+        return len(self._entries)
+
+    def __contains__(self, question):
+        """Exact-match membership test; doesn't count towards stats."""
+        return query_key(question) in self._by_key
+
+    def get(self, question):
+        """Return a :class:`CachedAnswer` for ``question``, or ``None``."""
+        tokens = normalize_query(question) if self.index is not None else None
+        with self._lock:
+            position = self._by_key.get(query_key(question))
+            if position is not None:
+                self.stats["hits"] += 1
+                return CachedAnswer(*self._entries[position])
+
+            if self.index is not None:
+                match = self.index.query(tokens, self.threshold)
+                if match is not None:
+                    entry_id, similarity = match
+                    self.stats["near_hits"] += 1
+                    return CachedAnswer(*self._entries[self._by_index_id[entry_id]], similarity)
+
+            self.stats["misses"] += 1
+            return None
+
+    def put(self, question, answer, references):
+        """Store an answer and update the similarity index incrementally."""
+        tokens = normalize_query(question)
+        key = query_key(question)
+        with self._lock:
+            position = self._by_key.get(key)
+            if position is not None:
+                self._entries[position] = (question, answer, references)
+                return
+            self._by_key[key] = len(self._entries)
+            self._entries.append((question, answer, references))
+            if self.index is not None and tokens:
+                self.index.add(tokens)
+                self._by_index_id.append(self._by_key[key])
+
+
+class AnswerBundle:
+    """Read-only, memory-mapped bundle of precomputed answers.
+
+    Layout: a fixed header, the answer records (one JSON object each) and an
+    open-addressing hash index of ``(key hash, offset, length)`` slots. Only
+    the header, the probed index slots and the matching record are read from
+    the mapping, so opening and lookups cost the same for any bundle size.
+    """
+
+    MAGIC = b"PPLXBND1"
+    VERSION = 2  # 1 keyed records on content words only
+    HEADER = Struct("<8sIIIIQ")  # magic, version, count, slots, reserved, index offset
+    SLOT = Struct("<QQII")  # key hash, record offset, record length, reserved
+
+    def __init__(self, path, codec=None):
+        self.path = path
+        self.codec = codec or default_codec
+        with open(path, "rb") as f:
+            self._mm = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        try:
+            magic, version, self.count, self.slots, _, self._index_offset = \
+                self.HEADER.unpack_from(self._mm, 0)
+        except struct_error:
+            self._mm.close()
+            raise ValueError(f"{path} is not an answer bundle")
+        if magic != self.MAGIC or version != self.VERSION:
+            self._mm.close()
+            raise ValueError(f"{path} is not an answer bundle (or has an unsupported version)")
+
+    def __len__(self):
+        return self.count
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
+
+    def close(self):
+        self._mm.close()
+
+    @staticmethod
+    def _hash(key):
+        # 0 marks an empty slot
+        return int.from_bytes(blake2b(key.encode("utf-8"), digest_size=8).digest(), "little") or 1
+
+    def get(self, question):
+        """Return the :class:`CachedAnswer` for ``question``, or ``None``."""
+        key = query_key(question)
+        key_hash = self._hash(key)
+        mask = self.slots - 1
+        slot = key_hash & mask
+        for _ in range(self.slots):
+            stored_hash, offset, length, _ = self.SLOT.unpack_from(
+                self._mm, self._index_offset + slot * self.SLOT.size
+            )
+            if stored_hash == 0:
+                return None
+            if stored_hash == key_hash:
+                record = self.codec.loads(self._mm[offset:offset + length])
+                if query_key(record["question"]) == key:
+                    return CachedAnswer(record["question"], record["answer"], record["references"])
+            slot = (slot + 1) & mask
+        return None
+
+    @classmethod
+    def write(cls, path, entries, codec=None):
+        """Write ``(question, answer, references)`` entries to a bundle at ``path``.
+
+        The file is written next to ``path`` and renamed into place, so readers
+        never see a partial bundle. Returns the number of entries written.
+        """
+        codec = codec or default_codec
+        records = []  # (key hash, offset, length); colliding hashes get their own slots
+        seen = set()
+        tmp_path = f"{path}.tmp"
+        with open(tmp_path, "wb") as f:
+            f.write(b"\0" * cls.HEADER.size)
+            for question, answer, references in entries:
+                key = query_key(question)
+                if key in seen:
+                    continue
+                seen.add(key)
+                record = codec.dumps({"question": question, "answer": answer, "references": references})
+                records.append((cls._hash(key), f.tell(), len(record)))
+                f.write(record)
+
+            count = len(records)
+            slots = 1
+            while slots < count * 2:
+                slots *= 2
+            index = [(0, 0, 0, 0)] * slots
+            for key_hash, offset, length in records:
+                slot = key_hash & (slots - 1)
+                while index[slot][0]:
+                    slot = (slot + 1) & (slots - 1)
+                index[slot] = (key_hash, offset, length, 0)
+
+            index_offset = f.tell()
+            for entry in index:
+                f.write(cls.SLOT.pack(*entry))
+            f.seek(0)
+            f.write(cls.HEADER.pack(cls.MAGIC, cls.VERSION, count, slots, 0, index_offset))
+        os.replace(tmp_path, path)
+        return count
+
+
+def read_questions(path):
+    """Read one question per line, skipping blanks, comments and duplicates."""
+    questions = []
+    seen = set()
+    with open(path, "r", encoding="utf-8") as f:
+        for line in f:
+            question = line.strip()
+            if not question or question.startswith("#"):
+                continue
+            key = query_key(question)
+            if key not in seen:
+                seen.add(key)
+                questions.append(question)
+    return questions
+
+
+def resolve_question(question, clients=None, stop=None):
+    """Ask a single question on its own connection; returns ``(answer, references)``.
+
+    The client is registered in ``clients`` while it runs so a batch can be
+    cancelled; nothing is sent once ``stop`` is set.
+    """
+    if stop is not None and stop.is_set():
+        return None, []
+    with Perplexity() as client:
+        if clients is not None:
+            clients.add(client)
+        try:
+            return extract_answer_from_response(list(client.generate_answer(question)))
+        finally:
+            if clients is not None:
+                clients.discard(client)
+
+
+def build_bundle(questions_path, output_path, workers=4):
+    """Resolve every question in ``questions_path`` in parallel and write a bundle."""
+    questions = read_questions(questions_path)
+    print(f"{tColor.aqua}📦 Resolving {len(questions)} questions with {workers} workers...{tColor.reset}")
+
+    entries = []
+    failed = 0
+    clients = set()  # Clients in flight, for cancellation
+    stop = Event()
+    with ThreadPoolExecutor(max_workers=workers) as pool:
+        futures = {
+            pool.submit(resolve_question, question, clients, stop): question
+            for question in questions
+        }
+        try:
+            for done, future in enumerate(as_completed(futures), 1):
+                question = futures[future]
+                try:
+                    answer, references = future.result()
+                except Exception as e:
+                    answer, references = None, []
+                    print(f"{tColor.red}❌ {question}: {e}{tColor.reset}")
+                if answer:
+                    entries.append((question, answer, references))
+                else:
+                    failed += 1
+                print(f"\r{tColor.aqua}{done}/{len(questions)} resolved{tColor.reset}", end='', flush=True)
+        except KeyboardInterrupt:
+            # Skip queued questions and cancel the ones in flight
+            stop.set()
+            for client in list(clients):
+                client.cancel()
+            print(f"\n{tColor.yellow}🛑 Cancelled, no bundle written.{tColor.reset}")
+            return False
+    print()
+
+    count = AnswerBundle.write(output_path, entries)
+    print(f"{tColor.green}✅ Wrote {count} answers to {output_path}{tColor.reset}")
+    if failed:
+        print(f"{tColor.yellow}⚠️  {failed} questions returned no answer and were skipped{tColor.reset}")
+    return failed == 0
+
+
+def bundle_command(args):
+    """Handle ``pplx bundle build QUESTIONS -o OUTPUT [-j WORKERS]``."""
+    usage = "Usage: pplx bundle build QUESTIONS.txt -o OUTPUT.pplx [-j WORKERS]"
+    options = {"output": None, "workers": "4"}
+    names = {"-o": "output", "--output": "output", "-j": "workers", "--jobs": "workers"}
+    positional = []
+    args = list(args)
+    while args:
+        arg = args.pop(0)
+        if arg in names and args:
+            options[names[arg]] = args.pop(0)
+        else:
+            positional.append(arg)
+
+    if len(positional) != 2 or positional[0] != "build" or not options["output"]:
+        print(f"{tColor.red}{usage}{tColor.reset}")
+        return False
+    return build_bundle(positional[1], options["output"], max(1, int(options["workers"])))
+
+
+def answer_from_bundle(path, question):
+    """Answer ``question`` from a bundle without touching the network."""
+    with AnswerBundle(path) as bundle:
+        cached = bundle.get(question)
+    if cached is None:
+        print(f"{tColor.red}❌ Not found in bundle {path}: {question}{tColor.reset}")
+        return False
+    show_answer(cached.answer, cached.references)
+    return True
+
+
+class StdioServer:
+    """Line-delimited JSON-RPC 2.0 server on stdin/stdout.
+
+    Methods:
+
+    - ``ask`` ``{"query": str, "cache": bool}``: answer a question. With
+      ``cache`` (default ``cache_by_default``, set by ``--cache`` or
+      ``--similar``) answers are reused from and stored in ``cache``. Result:
+      ``{"answer", "references", "cached"}``. Upstream delivers the answer
+      only in its final frame, so there are no partial-answer notifications;
+      the result is sent as soon as that frame arrives.
+    - ``cancel`` ``{"id": <ask id>}``: cancel an ask; it then fails with
+      code ``-32800``.
+    - ``stats``: request counters, cache stats and average latency.
+
+    Asks run concurrently on a pool of ``connections`` warm connections, so
+    many request ids can be in flight over the one pipe.
+    """
+
+    PARSE_ERROR = -32700
+    INVALID_REQUEST = -32600
+    METHOD_NOT_FOUND = -32601
+    INVALID_PARAMS = -32602
+    INTERNAL_ERROR = -32603
+    REQUEST_CANCELLED = -32800
+
+    def __init__(self, connections=4, cache=None, infile=None, outfile=None, cache_by_default=False):
+        self.connections = connections
+        self.cache = cache if cache is not None else AnswerCache()
+        self.cache_by_default = cache_by_default
+        self.infile = infile or sys.stdin.buffer
+        self.outfile = outfile or sys.stdout.buffer
+        self.codec = default_codec
+        self._lock = Lock()
+        self._write_lock = Lock()
+        self._local = local()
+        self._warm_clients = []
+        self._in_flight = {}  # ask id -> (WarmClient, request id) once sent
+        self._cancelled = set()
+        self.stats = {"requests": 0, "answered": 0, "cached": 0, "cancelled": 0, "errors": 0}
+        self._latency_total = 0.0
+
+    def serve(self):
+        """Handle requests until stdin is closed, then finish the asks in flight.
+
+        Closing stdin only means no more requests; a ``KeyboardInterrupt``
+        (SIGINT, or SIGTERM in :func:`stdio_mode`) cancels the asks instead.
+        """
+        self._pool = ThreadPoolExecutor(max_workers=self.connections)
+        try:
+            for line in self.infile:
+                if line.strip():
+                    try:
+                        self._handle(line)
+                    except Exception as e:  # Keep serving; one bad request mustn't end the process
+                        self._error(None, self.INTERNAL_ERROR, f"Internal error: {e}")
+            self._pool.shutdown(wait=True)
+        except KeyboardInterrupt:
+            for msg_id in list(self._in_flight):
+                self._cancel_ask(msg_id)
+            raise
+        finally:
+            self._pool.shutdown(wait=True)
+            for warm in self._warm_clients:
+                warm.close()
+
+    def _send(self, message):
+        data = self.codec.dumps(message) + b"\n"
+        with self._write_lock:
+            self.outfile.write(data)
+            self.outfile.flush()
+
+    def _result(self, msg_id, result):
+        self._send({"jsonrpc": "2.0", "id": msg_id, "result": result})
+
+    def _error(self, msg_id, code, message):
+        self._send({"jsonrpc": "2.0", "id": msg_id, "error": {"code": code, "message": message}})
+
+    @staticmethod
+    def _valid_id(msg_id):
+        return msg_id is None or isinstance(msg_id, str) or (
+            isinstance(msg_id, int) and not isinstance(msg_id, bool)
+        )
+
+    def _handle(self, line):
+        try:
+            request = self.codec.loads(line)
+        except ValueError:
+            self._error(None, self.PARSE_ERROR, "Parse error")
+            return
+        if not isinstance(request, dict) or not isinstance(request.get("method"), str):
+            self._error(None, self.INVALID_REQUEST, "Invalid request")
+            return
+
+        msg_id = request.get("id")
+        if not self._valid_id(msg_id):
+            self._error(None, self.INVALID_REQUEST, "'id' must be a string, an integer or null")
+            return
+        method = request["method"]
+        params = request.get("params") or {}
+        notification = "id" not in request  # Never answered, per JSON-RPC 2.0
+        if method == "ask":
+            if notification:
+                return  # Its answer could never be delivered
+            query = params.get("query") if isinstance(params, dict) else None
+            if not isinstance(query, str) or not query.strip():
+                self._error(msg_id, self.INVALID_PARAMS, "'query' must be a non-empty string")
+                return
+            with self._lock:
+                if msg_id is None or msg_id in self._in_flight:
+                    self._error(msg_id, self.INVALID_REQUEST, "ask needs a unique id")
+                    return
+                self._in_flight[msg_id] = None
+                self.stats["requests"] += 1
+            self._pool.submit(
+                self._ask, msg_id, query.strip(), params.get("cache", self.cache_by_default)
+            )
+        elif method == "cancel":
+            target = params.get("id") if isinstance(params, dict) else None
+            if not self._valid_id(target):
+                self._error(msg_id, self.INVALID_PARAMS, "'id' must be a string, an integer or null")
+                return
+            cancelled = self._cancel_ask(target)
+            if not notification:
+                self._result(msg_id, {"cancelled": cancelled})
+        elif notification:
+            return
+        elif method == "stats":
+            self._result(msg_id, self._stats())
+        else:
+            self._error(msg_id, self.METHOD_NOT_FOUND, f"Method not found: {method}")
+
+    def _warm_client(self):
+        warm = getattr(self._local, "warm", None)
+        if warm is None:
+            warm = self._local.warm = WarmClient()
+            with self._lock:
+                self._warm_clients.append(warm)
+        return warm
+
+    def _cancel_ask(self, msg_id):
+        with self._lock:
+            if msg_id not in self._in_flight:
+                return False
+            self._cancelled.add(msg_id)
+            active = self._in_flight[msg_id]
+        if active is not None:
+            warm, request_id = active
+            warm.cancel(request_id)
+        return True
+
+    def _was_cancelled(self, msg_id):
+        with self._lock:
+            return msg_id in self._cancelled
+
+    def _ask(self, msg_id, query, use_cache):
+        start = time()
+        outcome = "errors"
+        try:
+            if self._was_cancelled(msg_id):  # Cancelled while queued
+                outcome = "cancelled"
+                self._error(msg_id, self.REQUEST_CANCELLED, "Request cancelled")
+                return
+            if use_cache:
+                with self._lock:
+                    cached = self.cache.get(query)
+                if cached is not None:
+                    outcome = "cached"
+                    self._result(msg_id, {
+                        "answer": cached.answer, "references": cached.references, "cached": True,
+                    })
+                    return
+
+            warm = self._warm_client()
+            client = warm.get()
+            if self._was_cancelled(msg_id):  # Cancelled while connecting
+                outcome = "cancelled"
+                self._error(msg_id, self.REQUEST_CANCELLED, "Request cancelled")
+                return
+            request_id = client.ask(query)
+            with self._lock:
+                self._in_flight[msg_id] = (warm, request_id)
+                cancelled = msg_id in self._cancelled
+            if cancelled:  # Cancelled while the question was being sent
+                client.cancel(request_id)
+
+            frames = list(client.stream(request_id))
+
+            if client.cancelled:
+                outcome = "cancelled"
+                self._error(msg_id, self.REQUEST_CANCELLED, "Request cancelled")
+                return
+            answer, references = extract_answer_from_response(frames)
+            if not answer:
+                self._error(msg_id, self.INTERNAL_ERROR, "No answer received")
+                return
+            if use_cache:
+                with self._lock:
+                    self.cache.put(query, answer, references)
+            outcome = "answered"
+            self._result(msg_id, {"answer": answer, "references": references, "cached": False})
+        except Exception as e:
+            self._error(msg_id, self.INTERNAL_ERROR, str(e))
+        finally:
+            with self._lock:
+                self._in_flight.pop(msg_id, None)
+                self._cancelled.discard(msg_id)
+                self.stats[outcome] += 1
+                self._latency_total += time() - start
+
+    def _stats(self):
+        with self._lock:
+            done = sum(self.stats[k] for k in ("answered", "cached", "cancelled", "errors"))
+            return dict(
+                self.stats,
+                in_flight=len(self._in_flight),
+                connections=sum(1 for warm in self._warm_clients if warm.client is not None),
+                cache=dict(self.cache.stats, entries=len(self.cache)),
+                avg_latency_ms=round(self._latency_total / done * 1000, 1) if done else None,
+            )
+
+
+def stdio_mode(similarity=None, use_cache=False):
+    """Run as a persistent JSON-RPC coprocess on stdin/stdout.
+
+    Stdout carries only JSON-RPC messages; errors are reported on stderr.
+    SIGTERM cancels the asks in flight like Ctrl+C.
+    """
+    signal.signal(signal.SIGTERM, signal.default_int_handler)
+    try:
+        StdioServer(
+            cache=AnswerCache(threshold=similarity),
+            cache_by_default=use_cache or similarity is not None,
+        ).serve()
+    except KeyboardInterrupt:
+        pass
+    except Exception as e:
+        print(f"Unexpected error: {e}", file=sys.stderr)
+        sys.exit(1)
+
+
+DEFAULT_PREFETCH = 2
+
+
+class Prefetcher:
+    """Speculatively answers suggested follow-up questions in the background.
+
+    After each answer, :meth:`schedule` queues the top ``per_answer``
+    suggestions that aren't cached yet. A background thread answers them one
+    at a time on its own warm connection and stores the results in ``cache``,
+    so picking a suggestion is served locally. At most ``budget`` prefetches
+    are queued or sent per session, and :meth:`cancel` drops queued and
+    in-flight prefetches once they are stale; dropped ones that were never
+    sent give their budget back. ``stats["issued"]`` counts only requests
+    actually sent upstream.
+    """
+
+    def __init__(self, cache, per_answer=2, budget=20):
+        self.cache = cache
+        self.per_answer = per_answer
+        self.budget = budget
+        self.suggestions = []
+        self.warm = WarmClient()
+        self.stats = {"issued": 0, "completed": 0, "hits": 0, "cancelled": 0, "over_budget": 0}
+        self._lock = Lock()  # stats, budget and keys are shared with the prefetch thread
+        self._spent = 0  # budget used by queued and sent prefetches
+        self._generation = 0  # bumped by cancel(); older queue entries are stale
+        self._queue = Queue()
+        self._prefetched = set()  # keys answered speculatively and not used yet
+        self._related = {}
+        self._current = None
+        self._idle = Condition()
+        self._waiting = False
+        self._interrupted = False
+        self._thread = Thread(target=self._run, name="perplexity-prefetch", daemon=True)
+        self._thread.start()
+
+    def schedule(self, question, related):
+        """Record the suggestions for ``question`` and prefetch the top ones."""
+        with self._lock:
+            self._related[query_key(question)] = related
+            self.suggestions = related
+            for suggestion in related[:self.per_answer]:
+                if suggestion in self.cache:
+                    continue
+                if self._spent >= self.budget:
+                    self.stats["over_budget"] += 1
+                    continue
+                self._spent += 1
+                self._queue.put((self._generation, suggestion))
+        return related
+
+    def related_for(self, question):
+        """Suggestions recorded for an earlier ``question``."""
+        with self._lock:
+            return self._related.get(query_key(question), [])
+
+    def record_hit(self, question):
+        """Count a cache hit; returns ``True`` if a prefetch answered it."""
+        key = query_key(question)
+        with self._lock:
+            if key in self._prefetched:
+                self._prefetched.discard(key)
+                self.stats["hits"] += 1
+                return True
+            return False
+
+    def is_loading(self, question):
+        """Whether ``question`` is being prefetched right now."""
+        key = query_key(question)
+        with self._idle:
+            return self._current is not None and query_key(self._current) == key
+
+    def wait_for(self, question, timeout=30):
+        """Wait if ``question`` is being prefetched right now.
+
+        Returns ``False`` if the wait was cut short by :meth:`interrupt`.
+        """
+        key = query_key(question)
+        with self._idle:
+            self._waiting = True
+            self._interrupted = False
+            try:
+                self._idle.wait_for(
+                    lambda: self._interrupted or self._current is None or query_key(self._current) != key,
+                    timeout,
+                )
+            finally:
+                self._waiting = False
+            return not self._interrupted
+
+    def interrupt(self):
+        """Cancel the prefetch being waited for and wake :meth:`wait_for`.
+
+        Meant for the Ctrl+C handler; returns ``True`` if a wait was interrupted.
+        """
+        if not self._waiting:
+            return False
+        self._interrupted = True
+        self.cancel()
+        with self._idle:
+            self._idle.notify_all()
+        return True
+
+    def cancel(self):
+        """Drop queued prefetches and cancel the one in flight."""
+        with self._lock:
+            # A prefetch taken off the queue but not sent yet sees the new
+            # generation and is dropped; one already sent is cancelled below
+            self._generation += 1
+            while True:
+                try:
+                    self._queue.get_nowait()
+                except Empty:
+                    break
+                self._spent -= 1
+                self.stats["cancelled"] += 1
+            if self.warm.cancel():
+                self.stats["cancelled"] += 1
+
+    def close(self):
+        self.cancel()
+        self._queue.put(None)
+        self.warm.close()
+
+    def _drop(self, cancelled):
+        """Give back the budget of a prefetch that was never sent."""
+        with self._lock:
+            self._spent -= 1
+            if cancelled:
+                self.stats["cancelled"] += 1
+
+    def _run(self):
+        while True:
+            item = self._queue.get()
+            if item is None:
+                return
+            generation, question = item
+            if question in self.cache:  # Answered meanwhile; nothing to spend
+                self._drop(cancelled=False)
+                continue
+            with self._idle:
+                self._current = question
+            sent = False
+            try:
+                client = self.warm.get()
+                with self._lock:
+                    stale = generation != self._generation
+                    if not stale:
+                        request_id = client.ask(question)
+                        sent = True
+                        self.stats["issued"] += 1
+                if stale:
+                    self._drop(cancelled=True)
+                    continue
+                frames = list(client.stream(request_id))
+                if not client.cancelled:
+                    answer, references = extract_answer_from_response(frames)
+                    if answer:
+                        self.cache.put(question, answer, references)
+                        with self._lock:
+                            self._related[query_key(question)] = extract_related_queries(frames)
+                            self._prefetched.add(query_key(question))
+                            self.stats["completed"] += 1
+            except Exception:
+                if not sent:  # Speculative work: failures are silent
+                    self._drop(cancelled=False)
+            finally:
+                with self._idle:
+                    self._current = None
+                    self._idle.notify_all()
+
+
+def show_suggestions(suggestions):
+    """Display suggested follow-up questions."""
+    if not suggestions:
+        return
+    print(f"{tColor.bold}💡 Suggested follow-ups:{tColor.reset}")
+    for i, suggestion in enumerate(suggestions[:5]):
+        print(f"  {tColor.aqua}[{i+1}]{tColor.reset} {suggestion}")
+    print(f"  Type {tColor.green}/follow N{tColor.reset} to ask one\n")
+
+
+def show_stats(cache, prefetcher=None):
+    """Display cache and speculative prefetch statistics."""
+    print(f"\n{tColor.bold}📊 Session Stats:{tColor.reset}")
+    if cache is None:
+        print(f"  Cache: off • Start with {tColor.green}--cache{tColor.reset} or {tColor.green}--similar{tColor.reset} to reuse answers")
+    else:
+        stats = cache.stats
+        print(f"  Cache: {len(cache)} answers • {stats['hits']} hits • "
+              f"{stats['near_hits']} similar • {stats['misses']} misses")
+    if prefetcher is not None:
+        stats = prefetcher.stats
+        hit_rate = stats["hits"] / stats["completed"] if stats["completed"] else 0
+        print(f"  Prefetch: {stats['issued']} extra requests • {stats['completed']} completed • "
+              f"{stats['hits']} used ({hit_rate:.0%} hit rate)")
+        print(f"  Prefetch: {stats['cancelled']} cancelled • {stats['over_budget']} skipped over budget "
+              f"({prefetcher.budget} per session)")
+    print()
+
+
 def quick_question():
     prompt = sys.argv[1]
     try:
-        answer_list = list(Perplexity().generate_answer(prompt))
+        with Perplexity() as client:
+            answer_list = list(client.generate_answer(prompt))
         answer, references = extract_answer_from_response(answer_list)
         
         if answer:
@@ -226,10 +1630,23 @@ def print_help():
     print(f"{tColor.bold}Options:{tColor.reset}")
     print("  --version, -v     Show version information")
     print("  --help, -h        Show this help message")
+    print("  --cache           Reuse answers to repeated questions (interactive)")
+    print("  --similar[=0.8]   Reuse answers to similar questions (interactive)")
+    print("  --bundle FILE     Answer offline from a prebuilt answer bundle")
+    print("  --no-session-cache  Don't reuse cached session cookies")
+    print("  --stdio           Run as a JSON-RPC coprocess on stdin/stdout")
+    print("  --speculative[=2] Prefetch suggested follow-ups (interactive)")
+    print()
+    print(f"{tColor.bold}Offline Bundles:{tColor.reset}")
+    print("  pplx bundle build questions.txt -o kb.pplx [-j 4]")
+    print("  pplx --bundle kb.pplx 'your question'")
     print()
     print(f"{tColor.bold}Interactive Commands:{tColor.reset}")
     print("  /help             Show interactive commands")
     print("  /refs             Show references from last answer")
+    print("  /retry            Ask the last question again, bypassing the cache")
+    print("  /follow N         Ask suggested follow-up N (with --speculative)")
+    print("  /stats            Show cache and prefetch statistics")
     print("  /clear            Clear the screen")
     print("  /quit             Exit the program")
     print()
@@ -241,29 +1658,35 @@ def print_help():
     print("  pplx 'How does AI work?'")
 
 
+def show_answer(answer, references):
+    """Print an answer and its top references (non-interactive mode)."""
+    print(f"{tColor.bold}🤖 Answer:{tColor.reset}")
+    print(f"{tColor.bold}{'─' * 50}{tColor.reset}")
+    print(render_markdown(answer, references))
+    
+    if references:
+        print(f"\n{tColor.bold}📚 References ({len(references)} sources):{tColor.reset}")
+        for i, ref in enumerate(references[:5]):  # Show max 5 references
+            name = ref.get('name', 'Unknown Source')
+            url = ref.get('url', 'No URL')
+            print(f"{tColor.blue}[{i+1}]{tColor.reset} {name}")
+            print(f"    {url}")
+        if len(references) > 5:
+            print(f"    {tColor.yellow}... and {len(references)-5} more sources{tColor.reset}")
+
+
 def answer_question(question):
     """Answer a single question (non-interactive mode)."""
     try:
         print(f"{tColor.aqua}🔍 Question: {question}{tColor.reset}")
         print(f"{tColor.aqua}🔄 Searching the web...{tColor.reset}\n")
         
-        answer_list = list(Perplexity().generate_answer(question))
+        with Perplexity() as client:
+            answer_list = list(client.generate_answer(question))
         answer, references = extract_answer_from_response(answer_list)
         
         if answer:
-            print(f"{tColor.bold}🤖 Answer:{tColor.reset}")
-            print(f"{tColor.bold}{'─' * 50}{tColor.reset}")
-            print(f"{tColor.aqua2}{answer}{tColor.reset}")
-            
-            if references:
-                print(f"\n{tColor.bold}📚 References ({len(references)} sources):{tColor.reset}")
-                for i, ref in enumerate(references[:5]):  # Show max 5 references
-                    name = ref.get('name', 'Unknown Source')
-                    url = ref.get('url', 'No URL')
-                    print(f"{tColor.blue}[{i+1}]{tColor.reset} {name}")
-                    print(f"    {url}")
-                if len(references) > 5:
-                    print(f"    {tColor.yellow}... and {len(references)-5} more sources{tColor.reset}")
+            show_answer(answer, references)
         else:
             print(f"{tColor.red}❌ No answer received. Please try again or rephrase your question.{tColor.reset}")
             
@@ -329,14 +1752,25 @@ def get_multiline_input(prompt_text):
     return "\\n".join(lines) if lines else ""
 
 
-def interactive_mode():
-    """Run the CLI in enhanced interactive mode."""
+def interactive_mode(similarity=None, speculative=None, use_cache=False):
+    """Run the CLI in enhanced interactive mode.
+
+    With ``use_cache`` answers are cached for the session; ``similarity``
+    enables near-duplicate lookups above that threshold (see
+    :class:`AnswerCache`). ``speculative`` prefetches that many suggested
+    follow-ups after each answer. Both imply ``use_cache``.
+    """
     # Setup signal handling for cleaner Ctrl+C experience
     ctrl_c_count = 0
     last_ctrl_c_time = 0
+    warm = WarmClient()
     
     def signal_handler(signum, frame):
         nonlocal ctrl_c_count, last_ctrl_c_time
+        # Ctrl+C while answering cancels the answer but keeps the connection
+        if warm.cancel() or (prefetcher is not None and prefetcher.interrupt()):
+            return
+        
         current_time = time()
         
         # Reset counter if more than 5 seconds have passed
@@ -354,6 +1788,9 @@ def interactive_mode():
             print(f"\r{' ' * 80}\r", end='', flush=True)  # Clear the warning message line
             print(f"\r{tColor.yellow}🛑 Session ended. Have a great day!{tColor.reset}")
             print(f"{tColor.bold}╰──────────────────────────────────────────────────────────────────────────────╯{tColor.reset}")
+            if prefetcher is not None:
+                prefetcher.close()
+            warm.close()
             sys.exit(0)
     
     # Set up the signal handler
@@ -382,6 +1819,11 @@ def interactive_mode():
 
     references = []
     conversation_count = 0
+    cache = None
+    if use_cache or similarity is not None or speculative:
+        cache = AnswerCache(threshold=similarity)
+    prefetcher = Prefetcher(cache, per_answer=speculative) if speculative else None
+    last_query = None
     
     while True:
         try:
@@ -407,10 +1849,36 @@ def interactive_mode():
                     continue
                 elif command == '/quit' or command == '/exit':
                     print(f"{tColor.yellow}👋 Goodbye!{tColor.reset}")
+                    if prefetcher is not None:
+                        prefetcher.close()
+                    warm.close()
                     break
+                elif command == '/stats':
+                    show_stats(cache, prefetcher)
+                    continue
+                elif command.split()[0] in ('/follow', '/f'):
+                    suggestions = prefetcher.suggestions if prefetcher is not None else []
+                    choice = command.split()[1] if len(command.split()) > 1 else ''
+                    if not choice.isdigit() or not 1 <= int(choice) <= min(len(suggestions), 5):
+                        print(f"{tColor.yellow}📭 No such suggestion. Use /follow N after an answer with suggestions (--speculative).{tColor.reset}\n")
+                        continue
+                    conversation_count += 1
+                    last_query = suggestions[int(choice) - 1]
+                    print(f"{tColor.aqua}❯ {last_query}{tColor.reset}")
+                    answer, references = process_query(last_query, conversation_count, cache, warm, prefetcher)
+                    continue
                 elif command == '/version':
                     show_version()
                     continue
+                elif command == '/retry':
+                    if last_query is None:
+                        print(f"{tColor.yellow}📭 Nothing to retry yet.{tColor.reset}\n")
+                        continue
+                    conversation_count += 1
+                    answer, references = process_query(last_query, conversation_count, warm=warm)
+                    if answer and cache is not None:
+                        cache.put(last_query, answer, references)
+                    continue
                 else:
                     print(f"{tColor.red}❌ Unknown command: {command}{tColor.reset}")
                     print(f"   Type {tColor.green}/help{tColor.reset} for available commands\n")
@@ -420,7 +1888,8 @@ def interactive_mode():
             if line.strip():
                 # Send the prompt immediately
                 conversation_count += 1
-                answer, references = process_query(line.strip(), conversation_count)
+                last_query = line.strip()
+                answer, references = process_query(last_query, conversation_count, cache, warm, prefetcher)
                 
         except EOFError:
             continue
@@ -436,12 +1905,16 @@ def show_interactive_help():
     print(f"  {tColor.green}/refs{tColor.reset}    - Show references from last answer")
     print(f"  {tColor.green}/clear{tColor.reset}   - Clear the screen")
     print(f"  {tColor.green}/version{tColor.reset} - Show version information")
+    print(f"  {tColor.green}/retry{tColor.reset}   - Ask the last question again, bypassing the cache")
+    print(f"  {tColor.green}/follow N{tColor.reset} - Ask suggested follow-up N (with --speculative)")
+    print(f"  {tColor.green}/stats{tColor.reset}   - Show cache and prefetch statistics")
     print(f"  {tColor.green}/quit{tColor.reset}    - Exit the program")
     print(f"\n{tColor.bold}💬 Input Tips:{tColor.reset}")
     print(f"  • Press {tColor.aqua}Enter{tColor.reset} to send your question")
     print(f"  • Use {tColor.yellow}\\\\n{tColor.reset} at end of line for multiline input")
     print(f"  • Ask follow-up questions naturally")
     print(f"  • References are saved for each answer")
+    print(f"  • Press {tColor.yellow}Ctrl+C{tColor.reset} while an answer loads to cancel it")
     print(f"  • Press {tColor.yellow}Ctrl+C{tColor.reset} twice (within 5s) to exit safely\n")
 
 
@@ -463,10 +1936,79 @@ def show_references(references):
         print(f"   Ask a question first to see web sources!\n")
 
 
-def process_query(query, count):
-    """Process a user query and return the response."""
+def clear_search_messages():
+    """Clear the 'Searching the web...' lines before showing a result."""
+    print(f"\r{' ' * 50}\r", end='', flush=True)  # Clear current line
+    print(f"\033[A\r{' ' * 50}\r", end='', flush=True)  # Clear previous line (Searching...)
+    print(f"\033[A\r{' ' * 50}\r\033[B", end='', flush=True)  # Clear empty line and return
+
+
+def show_response(answer, references, note=None):
+    """Display an answer with the typing effect and reference count."""
+    # Clean response display without search messages
+    print(f" {tColor.purple}✦{tColor.reset} {tColor.bold}Response{tColor.reset}")
+    if note:
+        print(f"   {tColor.lavand}{note}{tColor.reset}")
+    print()
+    
+    # Stream the response through the Markdown renderer
+    renderer = MarkdownStreamRenderer(references)
+    print("  ", end='', flush=True)
+    for char in answer:
+        print(renderer.feed(char), end='', flush=True)
+        sleep(0.005)  # Faster typing effect
+    print(renderer.finish())
+    print()
+    
+    # Show reference count
+    if references:
+        print(f"{tColor.blue}📎 {len(references)} web sources used • Type {tColor.green}/refs{tColor.reset}{tColor.blue} to view{tColor.reset}")
+    
+    print()  # Extra spacing
+
+
+def process_query(query, count, cache=None, warm=None, prefetcher=None):
+    """Process a user query and return the response.
+
+    With a :class:`WarmClient`, the question is asked on its shared
+    connection and can be cancelled with :meth:`WarmClient.cancel`. With a
+    :class:`Prefetcher`, suggested follow-ups are shown and prefetched.
+    """
     print(f"\n{tColor.aqua}🔍 Searching the web...{tColor.reset}")
     
+    if cache is not None:
+        if prefetcher is not None and prefetcher.is_loading(query):
+            # Picked a suggestion that is still loading: wait for it
+            stop_spinner = Event()
+            spinner_thread = Thread(target=show_spinner, args=(stop_spinner,), daemon=True)
+            spinner_thread.start()
+            try:
+                finished = prefetcher.wait_for(query)
+            finally:
+                stop_spinner.set()
+                spinner_thread.join(timeout=0.2)
+            if not finished:
+                clear_search_messages()
+                print(f"{tColor.yellow}🛑 Answer cancelled. Ask something else!{tColor.reset}\n")
+                return None, []
+        cached = cache.get(query)
+        if cached is not None:
+            clear_search_messages()
+            if prefetcher is not None and prefetcher.record_hit(cached.question):
+                note = "⚡ Prefetched answer"
+            elif cached.exact:
+                note = "♻️  Cached answer"
+            else:
+                note = (f"♻️  Answer to a similar question ({cached.similarity:.0%} match): "
+                        f"\"{cached.question}\" • Type /retry for a fresh answer")
+            show_response(cached.answer, cached.references, note)
+            if prefetcher is not None:
+                show_suggestions(prefetcher.schedule(cached.question, prefetcher.related_for(cached.question)))
+            return cached.answer, cached.references
+    
+    if prefetcher is not None:
+        prefetcher.cancel()  # Stale suggestions; free the upstream for this question
+    
     try:
         # Show a simple progress indicator
         import threading
@@ -475,51 +2017,40 @@ def process_query(query, count):
         spinner_thread.daemon = True
         spinner_thread.start()
         
-        answer_list = list(Perplexity().generate_answer(query))
-        stop_spinner.set()
-        spinner_thread.join(timeout=0.1)
+        try:
+            client = warm.get() if warm is not None else Perplexity()
+            try:
+                answer_list = list(client.generate_answer(query))
+            finally:
+                if warm is None:
+                    client.close()
+        finally:
+            stop_spinner.set()
+            spinner_thread.join(timeout=0.1)
         
         answer, references = extract_answer_from_response(answer_list)
         
-        if answer:
-            # Clear the search messages before showing response
-            print(f"\r{' ' * 50}\r", end='', flush=True)  # Clear current line
-            print(f"\033[A\r{' ' * 50}\r", end='', flush=True)  # Clear previous line (Searching...)
-            print(f"\033[A\r{' ' * 50}\r\033[B", end='', flush=True)  # Clear empty line and return
-            
-            # Clean response display without search messages
-            print(f" {tColor.purple}✦{tColor.reset} {tColor.bold}Response{tColor.reset}")
-            print()
-            
-            # Stream the response with better formatting
-            print(f"  {tColor.aqua2}", end='', flush=True)
-            for i, char in enumerate(answer):
-                print(char, end='', flush=True)
-                sleep(0.005)  # Faster typing effect
-            print(f" {tColor.reset}")
-            print()
-            
-            # Show reference count
-            if references:
-                print(f"{tColor.blue}📎 {len(references)} web sources used • Type {tColor.green}/refs{tColor.reset}{tColor.blue} to view{tColor.reset}")
-            
-            print()  # Extra spacing
+        # Clear the search messages before showing the result
+        clear_search_messages()
+        
+        if client.cancelled:
+            print(f"{tColor.yellow}🛑 Answer cancelled. Ask something else!{tColor.reset}\n")
+            return None, []
+        elif answer:
+            if cache is not None:
+                cache.put(query, answer, references)
+            show_response(answer, references)
+            if prefetcher is not None:
+                show_suggestions(prefetcher.schedule(query, extract_related_queries(answer_list)))
             return answer, references
         else:
-            # Clear the search messages before showing error
-            print(f"\r{' ' * 50}\r", end='', flush=True)  # Clear current line
-            print(f"\033[A\r{' ' * 50}\r", end='', flush=True)  # Clear previous line (Searching...)
-            print(f"\033[A\r{' ' * 50}\r\033[B", end='', flush=True)  # Clear empty line and return
-            
             print(f"{tColor.red}❌ No answer received. Please try rephrasing your question.{tColor.reset}")
             print(f"   {tColor.yellow}Tip: Try being more specific or check your internet connection{tColor.reset}\n")
             return None, []
             
     except Exception as e:
         # Clear the search messages before showing error
-        print(f"\r{' ' * 50}\r", end='', flush=True)  # Clear current line
-        print(f"\033[A\r{' ' * 50}\r", end='', flush=True)  # Clear previous line (Searching...)
-        print(f"\033[A\r{' ' * 50}\r\033[B", end='', flush=True)  # Clear empty line and return
+        clear_search_messages()
         
         print(f"{tColor.red}💥 Error occurred: {str(e)}{tColor.reset}")
         print(f"   {tColor.yellow}Try again in a moment or rephrase your question{tColor.reset}\n")
@@ -537,31 +2068,85 @@ def show_spinner(stop_event):
     print('\r' + ' ' * 20 + '\r', end='', flush=True)  # Clear the spinner line
 
 
+def pop_flag(args, name, takes_value=False):
+    """Remove ``name`` or ``name=value`` from ``args``.
+
+    Returns ``None`` when the flag is absent, ``True`` when it is given
+    without a value and the value string otherwise. With ``takes_value``,
+    a bare ``name`` consumes the following argument as its value (``""``
+    when there is none).
+    """
+    for i, arg in enumerate(args):
+        if arg == name:
+            del args[i]
+            if takes_value:
+                return args.pop(i) if i < len(args) else ""
+            return True
+        if arg.startswith(name + "="):
+            del args[i]
+            return arg[len(name) + 1:]
+    return None
+
+
 def main():
     """Main entry point for the CLI application."""
+    # In --stdio mode stdout carries only JSON-RPC messages
+    out = sys.stderr if "--stdio" in sys.argv[1:] else sys.stdout
     try:
+        args = sys.argv[1:]
+        use_cache = pop_flag(args, "--cache") is not None
+        similar = pop_flag(args, "--similar")
+        similarity = None
+        if similar is not None:
+            similarity = DEFAULT_SIMILARITY if similar is True else float(similar)
+        
+        if not pop_flag(args, "--no-session-cache"):
+            # Reuse cookies from earlier runs for faster cold starts
+            Perplexity.state_cache = SessionStateCache()
+        
+        bundle = pop_flag(args, "--bundle", takes_value=True)
+        if bundle is not None and (not bundle or not args):
+            print(f"{tColor.red}Usage: pplx --bundle FILE.pplx 'your question'{tColor.reset}")
+            sys.exit(2)
+        
+        speculative = pop_flag(args, "--speculative")
+        if speculative is not None:
+            speculative = DEFAULT_PREFETCH if speculative is True else int(speculative)
+        
+        if pop_flag(args, "--stdio"):
+            stdio_mode(similarity, use_cache)
+            return
+        
         # Check for version flags
-        if len(sys.argv) > 1:
-            arg = sys.argv[1].lower()
+        if args:
+            arg = args[0].lower()
             if arg in ['--version', '-v', 'version']:
                 show_version()
                 return
             elif arg in ['--help', '-h', 'help']:
                 print_help()
                 return
+            elif arg == 'bundle':
+                if not bundle_command(args[1:]):
+                    sys.exit(1)
+                return
+            elif bundle:
+                if not answer_from_bundle(bundle, ' '.join(args)):
+                    sys.exit(1)
+                return
             else:
                 # Single question mode - join all arguments
-                question = ' '.join(sys.argv[1:])
+                question = ' '.join(args)
                 answer_question(question)
                 return
         
         # Interactive mode
-        interactive_mode()
+        interactive_mode(similarity, speculative, use_cache)
     except KeyboardInterrupt:
         # This handles Ctrl+C in non-interactive modes
-        print(f"\n{tColor.yellow}👋 Goodbye!{tColor.reset}")
+        print(f"\n{tColor.yellow}👋 Goodbye!{tColor.reset}", file=out)
     except Exception as e:
-        print(f"\n{tColor.red}Unexpected error: {e}{tColor.reset}")
+        print(f"\n{tColor.red}Unexpected error: {e}{tColor.reset}", file=out)
 
 
 if __name__ == "__main__":